@@ -4,30 +4,135 @@ MLX Model Downloader
 Downloads and verifies MLX models from Hugging Face
 """
 
+import gc
+import os
+import json
 import sys
+import signal
+import heapq
 import shutil
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+# Use the Rust-based multi-connection downloader when it is installed. The
+# flag is read by huggingface_hub at import time, so it must be set first.
+try:
+    import hf_transfer  # noqa: F401
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+except ImportError:
+    pass
+
 from huggingface_hub import snapshot_download
-from mlx_lm import load
+from huggingface_hub import constants as hf_constants
+
+# Number of files snapshot_download fetches in parallel
+DEFAULT_DOWNLOAD_WORKERS = 8
+
+# Written into a model's cache directory once it has loaded successfully
+VERIFIED_MARKER = ".mlx_verified"
+
+# Print per-file details when MLX_DL_VERBOSE=1
+VERBOSE = os.environ.get("MLX_DL_VERBOSE") == "1"
+
+# Hugging Face cache layout: model directories and partially downloaded blobs
+MODEL_DIR_PREFIX = "models--"
+INCOMPLETE_SUFFIX = ".incomplete"
+
+# How each model status is shown by list; {n} is the number of partial files
+STATUS_EMOJI = {
+    "complete": "✅",
+    "incomplete": "⚠️ ",
+    "not_downloaded": "⬜",
+    "no_blobs": "❓",
+    "unknown": "❓"
+}
+
+STATUS_TEXT = {
+    "complete": "Complete",
+    "incomplete": "Incomplete ({n} partial files)",
+    "not_downloaded": "Not downloaded",
+    "no_blobs": "No blobs",
+    "unknown": "Unknown status"
+}
 
-def download_model(model_name, verify=True, force_redownload=False):
+def _handle_download_sigint(signum, frame):
+    """Stop immediately on Ctrl-C instead of waiting for download threads"""
+    print("\n🛑 Download cancelled. Partial files will be resumed or cleaned on the next run.")
+    sys.stdout.flush()
+    # Worker threads can't be interrupted, so exit without joining them
+    os._exit(130)
+
+def get_download_workers():
+    """Get number of parallel file downloads (MLX_DL_WORKERS, default 8)"""
+    try:
+        return max(1, int(os.environ.get("MLX_DL_WORKERS", DEFAULT_DOWNLOAD_WORKERS)))
+    except ValueError:
+        print(f"⚠️  Invalid MLX_DL_WORKERS value, using {DEFAULT_DOWNLOAD_WORKERS}")
+        return DEFAULT_DOWNLOAD_WORKERS
+
+def _snapshot_download(**kwargs):
+    """Run snapshot_download, falling back to plain HTTP if hf_transfer is unusable"""
+    try:
+        return snapshot_download(**kwargs)
+    except (ImportError, ValueError) as e:
+        if not hf_constants.HF_HUB_ENABLE_HF_TRANSFER or "hf_transfer" not in str(e):
+            raise
+        print(f"⚠️  hf_transfer unavailable ({e}), falling back to standard download")
+        hf_constants.HF_HUB_ENABLE_HF_TRANSFER = False
+        return snapshot_download(**kwargs)
+
+
+def _mlx_memory_fn(mx, name):
+    """Look up an MLX memory function (moved from mx.metal to mx in newer MLX)"""
+    return getattr(mx, name, None) or getattr(mx.metal, name)
+
+def _load_and_release(model_name):
+    """Load a model to check it works, then free its weights and Metal buffers"""
+    # Imported here so list/status/clean don't pay for loading MLX
+    import mlx.core as mx
+    from mlx_lm import load
+    
+    # Stop the allocator from keeping freed buffers around while verifying
+    try:
+        previous_limit = _mlx_memory_fn(mx, "set_cache_limit")(0)
+    except Exception:
+        previous_limit = None
+    
+    try:
+        model, tokenizer = load(model_name)
+        del model, tokenizer
+    finally:
+        # Clean up memory
+        gc.collect()
+        try:
+            _mlx_memory_fn(mx, "clear_cache")()
+            if previous_limit is not None:
+                _mlx_memory_fn(mx, "set_cache_limit")(previous_limit)
+        except Exception:
+            pass
+
+
+def download_model(model_name, verify=True, force_redownload=False,
+                   allow_patterns=None, ignore_patterns=None):
     """Download and optionally verify an MLX model"""
     
     # Check current status
-    status, model_path, incomplete_files = get_model_status(model_name)
+    status = quick_status(model_name)
+    model_path = _model_path(model_name)
     
     if status == "complete" and not force_redownload:
         print(f"✅ Model {model_name} already downloaded and complete")
         if verify:
+            if _is_verified(model_path):
+                print(f"✅ Model already verified: {model_name}")
+                return True
             print("🔍 Verifying model loads correctly...")
             try:
-                model, tokenizer = load(model_name)
+                _load_and_release(model_name)
                 print(f"✅ Model verified: {model_name}")
-                
-                # Clean up memory
-                del model, tokenizer
-                import gc
-                gc.collect()
+                _mark_verified(model_path)
                 return True
             except Exception as e:
                 print(f"❌ Model verification failed: {e}")
@@ -36,36 +141,50 @@ def download_model(model_name, verify=True, force_redownload=False):
             return True
     
     if status == "incomplete":
+        _, _, incomplete_files = full_status(model_name)
         print(f"⚠️  Found incomplete download with {len(incomplete_files)} partial files")
         clean_incomplete_model(model_name)
     
     print(f"🔄 Downloading: {model_name}")
+    _invalidate_status_index()
     
     try:
-        # Download model files
-        local_path = snapshot_download(
-            repo_id=model_name,
-            local_files_only=False,
-            resume_download=True,
-            force_download=force_redownload
-        )
+        # Signal handlers can only be installed from the main thread; when
+        # called from another thread, leave Ctrl-C handling to the host
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        if on_main_thread:
+            previous_handler = signal.signal(signal.SIGINT, _handle_download_sigint)
+        try:
+            # Download model files
+            local_path = _snapshot_download(
+                repo_id=model_name,
+                local_files_only=False,
+                resume_download=True,
+                force_download=force_redownload,
+                max_workers=get_download_workers(),
+                allow_patterns=allow_patterns,
+                ignore_patterns=ignore_patterns
+            )
+        finally:
+            if on_main_thread:
+                signal.signal(signal.SIGINT, previous_handler)
+            _full_status_cached.cache_clear()
+            # A list run during the download may have saved intermediate statuses
+            _invalidate_status_index()
         print(f"✅ Downloaded to: {local_path}")
         
         # Verify final status
-        final_status, _, _ = get_model_status(model_name)
+        final_status = quick_status(model_name)
         if final_status != "complete":
             print(f"⚠️  Download may be incomplete (status: {final_status})")
         
         if verify:
             print("🔍 Verifying model loads correctly...")
             try:
-                model, tokenizer = load(model_name)
+                _load_and_release(model_name)
                 print(f"✅ Model verified: {model_name}")
-                
-                # Clean up memory
-                del model, tokenizer
-                import gc
-                gc.collect()
+                if final_status == "complete":
+                    _mark_verified(model_path)
                 
             except Exception as e:
                 print(f"❌ Model verification failed: {e}")
@@ -82,46 +201,185 @@ def get_cache_path():
     """Get Hugging Face cache directory"""
     return Path.home() / ".cache" / "huggingface" / "hub"
 
-def get_model_status(model_name):
-    """Check if model is downloaded and its status"""
-    cache_path = get_cache_path()
-    model_dir_name = f"models--{model_name.replace('/', '--')}"
-    model_path = cache_path / model_dir_name
+# Cache path as a plain string; model paths are built from it with string
+# operations since these functions run once per cached model
+_CACHE_STR = str(get_cache_path())
+
+def _model_path(model_name, dir_name=None):
+    """Get path of a model's cache directory, reusing dir_name when already known"""
+    if dir_name is None:
+        dir_name = f"{MODEL_DIR_PREFIX}{model_name.replace('/', '--')}"
+    return f"{_CACHE_STR}/{dir_name}"
+
+def quick_status(model_name, dir_name=None):
+    """Get only a model's status, stopping at the first partial file found"""
+    model_path = _model_path(model_name, dir_name)
+    if not os.path.isdir(model_path):
+        return "not_downloaded"
+    
+    # huggingface_hub writes refs/main and the snapshot directory before the
+    # files arrive, so partial blobs must still be ruled out first
+    try:
+        with os.scandir(f"{model_path}/blobs") as entries:
+            if any(entry.name.endswith(INCOMPLETE_SUFFIX) for entry in entries):
+                return "incomplete"
+    except OSError:
+        return "no_blobs"
     
-    if not model_path.exists():
+    return "complete" if _has_snapshot(model_path) else "unknown"
+
+def full_status(model_name, dir_name=None):
+    """Check if model is downloaded and its status, with its path and files"""
+    model_path = _model_path(model_name, dir_name)
+    return _full_status_cached(model_path, _status_key(model_path))
+
+def _status_key(model_path):
+    """Fingerprint of the directories a model's status depends on"""
+    key = []
+    for path in (model_path, f"{model_path}/blobs", f"{model_path}/snapshots"):
+        try:
+            key.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+def _read_main_ref(model_path):
+    """Get the snapshot commit hash from refs/main, or None if missing"""
+    try:
+        with open(f"{model_path}/refs/main") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def _has_snapshot(model_path):
+    """Check if the model has a snapshot, preferring the one named by refs/main"""
+    # refs/main names the current snapshot, which is cheaper to read than
+    # listing snapshots/; fall back to the listing when there is no ref
+    commit = _read_main_ref(model_path)
+    if commit is not None:
+        return os.path.isdir(f"{model_path}/snapshots/{commit}")
+    try:
+        with os.scandir(f"{model_path}/snapshots") as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=512)
+def _full_status_cached(model_path, mtime_key):
+    """Scan a model directory; cached until one of its directories changes"""
+    if not os.path.isdir(model_path):
         return "not_downloaded", None, []
     
-    blobs_path = model_path / "blobs"
-    if not blobs_path.exists():
+    blobs_path = f"{model_path}/blobs"
+    if not os.path.isdir(blobs_path):
         return "no_blobs", model_path, []
     
-    # Check for incomplete files
-    incomplete_files = list(blobs_path.glob("*.incomplete"))
-    all_files = list(blobs_path.glob("*"))
+    # Check for incomplete files, classifying blobs in a single directory pass
+    incomplete_files = []
+    all_files = []
+    try:
+        with os.scandir(blobs_path) as entries:
+            for entry in entries:
+                all_files.append(entry.path)
+                if entry.name.endswith(INCOMPLETE_SUFFIX):
+                    incomplete_files.append(entry.path)
+    except OSError:
+        # Unreadable blobs directory, same as quick_status
+        return "no_blobs", model_path, []
     
     if incomplete_files:
         return "incomplete", model_path, incomplete_files
     
-    # Check if snapshots exist
-    snapshots_path = model_path / "snapshots"
-    if snapshots_path.exists() and list(snapshots_path.glob("*")):
+    if _has_snapshot(model_path):
         return "complete", model_path, all_files
     
     return "unknown", model_path, all_files
 
-def clean_incomplete_model(model_name):
+def _verification_token(model_path):
+    """Fingerprint of a downloaded model: refs/main commit plus total blob size"""
+    commit = _read_main_ref(model_path)
+    if commit is None:
+        return None
+    try:
+        with os.scandir(f"{model_path}/blobs") as entries:
+            blobs_size = sum(entry.stat().st_size for entry in entries)
+    except OSError:
+        return None
+    return f"{commit}:{blobs_size}"
+
+def _is_verified(model_path):
+    """Check if the model passed verification and hasn't changed since"""
+    token = _verification_token(model_path)
+    if token is None:
+        return False
+    try:
+        with open(f"{model_path}/{VERIFIED_MARKER}") as f:
+            return f.read().strip() == token
+    except OSError:
+        return False
+
+def _mark_verified(model_path):
+    """Record that the model in its current state loads correctly"""
+    token = _verification_token(model_path)
+    if token is None:
+        return
+    try:
+        with open(f"{model_path}/{VERIFIED_MARKER}", "w") as f:
+            f.write(token)
+    except OSError as e:
+        print(f"⚠️  Could not write verification marker: {e}")
+
+def _clear_verified(model_path):
+    """Invalidate the verification marker of a model"""
+    try:
+        os.unlink(f"{model_path}/{VERIFIED_MARKER}")
+    except OSError:
+        pass
+
+def _unlink_files(paths, max_workers=16):
+    """Delete files in parallel, returning the removed count and (path, error) failures"""
+    lock = threading.Lock()
+    removed_count = 0
+    failures = []
+    
+    def unlink(path):
+        nonlocal removed_count
+        try:
+            os.unlink(path)
+        except OSError as e:
+            with lock:
+                failures.append((path, e))
+        else:
+            with lock:
+                removed_count += 1
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(unlink, paths))
+    return removed_count, failures
+
+def clean_incomplete_model(model_name, dir_name=None):
     """Clean incomplete downloads for a model"""
-    status, _, files = get_model_status(model_name)
+    status, model_path, files = full_status(model_name, dir_name)
     incomplete_files = files if status == "incomplete" else []
     
     if status == "incomplete":
+        _clear_verified(model_path)
         print(f"🧹 Cleaning {len(incomplete_files)} incomplete files for {model_name}")
-        for file_path in incomplete_files:
-            try:
-                file_path.unlink()
-                print(f"   Removed: {file_path.name}")
-            except Exception as e:
-                print(f"   ❌ Failed to remove {file_path.name}: {e}")
+        removed_count, failures = _unlink_files(incomplete_files)
+        if VERBOSE:
+            failed_paths = {file_path for file_path, _ in failures}
+            removed_names = [os.path.basename(f) for f in incomplete_files if f not in failed_paths]
+            if removed_names:
+                print("   Removed: " + ", ".join(removed_names))
+            for file_path, e in failures:
+                print(f"   ❌ Failed to remove {os.path.basename(file_path)}: {e}")
+        else:
+            print(f"   Removed {removed_count} files")
+            if failures:
+                file_path, e = failures[0]
+                print(f"   ❌ Failed to remove {len(failures)} files ({os.path.basename(file_path)}: {e})")
+        _full_status_cached.cache_clear()
+        _invalidate_status_index()
         return True
     elif status == "not_downloaded":
         print(f"ℹ️  Model {model_name} not downloaded yet")
@@ -130,83 +388,243 @@ def clean_incomplete_model(model_name):
         print(f"✅ Model {model_name} appears complete")
         return False
 
-def remove_model(model_name):
+def _fast_rmtree(path):
+    """Remove a directory tree, unlinking its files in parallel"""
+    # Never walk through a symlinked model directory; shutil.rmtree refuses
+    # it without touching the link target
+    if os.path.islink(path):
+        shutil.rmtree(path)
+        return
+    
+    # Rename first so other invocations never see a half-deleted model
+    parent, name = os.path.split(path)
+    trash_path = os.path.join(parent, f".{name}.removing-{os.getpid()}")
+    try:
+        os.rename(path, trash_path)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    
+    try:
+        try:
+            files = []
+            dirs = []
+            # Bottom-up walk, so every directory comes after its subdirectories
+            for root, dir_names, file_names in os.walk(trash_path, topdown=False):
+                files.extend(os.path.join(root, file_name) for file_name in file_names)
+                for dir_name in dir_names:
+                    dir_path = os.path.join(root, dir_name)
+                    # Symlinks to directories are listed as directories but need unlink
+                    (files if os.path.islink(dir_path) else dirs).append(dir_path)
+            dirs.append(trash_path)
+            
+            _, failures = _unlink_files(files, max_workers=32)
+            if failures:
+                raise failures[0][1]
+            for dir_path in dirs:
+                os.rmdir(dir_path)
+        except OSError:
+            shutil.rmtree(trash_path)
+    except BaseException as e:
+        # Also on Ctrl-C: put what's left back where remove can find and retry it
+        try:
+            os.rename(trash_path, path)
+        except OSError:
+            if isinstance(e, OSError):
+                raise OSError(e.errno, f"{e.strerror}; partially removed model left at {trash_path}") from e
+            print(f"⚠️  Partially removed model left at {trash_path}")
+        raise
+
+def remove_model(model_name, dir_name=None):
     """Completely remove a model from cache"""
-    status, model_path, _ = get_model_status(model_name)
+    status = quick_status(model_name, dir_name)
+    model_path = _model_path(model_name, dir_name)
     
     if status == "not_downloaded":
         print(f"ℹ️  Model {model_name} not found in cache")
         return False
     
     try:
-        shutil.rmtree(model_path)
+        _clear_verified(model_path)
+        _fast_rmtree(model_path)
+        _full_status_cached.cache_clear()
+        _invalidate_status_index()
         print(f"🗑️  Completely removed {model_name} from cache")
         return True
     except Exception as e:
         print(f"❌ Failed to remove {model_name}: {e}")
         return False
 
-def discover_local_models():
-    """Discover all downloaded models in cache directory"""
-    cache_path = get_cache_path()
-    models = []
-    
-    if not cache_path.exists():
-        return models
+def iter_local_models():
+    """Yield (model_name, dir_name) of downloaded models in cache directory order"""
+    if not os.path.isdir(_CACHE_STR):
+        return
     
     # Look for model directories (format: models--org--model)
-    for model_dir in cache_path.glob("models--*"):
-        if model_dir.is_dir():
-            # Convert directory name back to model name format
-            # "models--mlx-community--Llama-3.2-3B-Instruct-4bit" -> "mlx-community/Llama-3.2-3B-Instruct-4bit"
-            dir_name = model_dir.name
-            if dir_name.startswith("models--"):
-                model_name = dir_name[8:]  # Remove "models--" prefix
-                # Split on "--" and rejoin properly: org/model-name-parts
-                parts = model_name.split("--")
-                if len(parts) >= 2:
-                    # First part is organization, rest is model name with dashes
-                    org = parts[0]
-                    model_parts = parts[1:]
-                    model_name = f"{org}/{'-'.join(model_parts)}"
-                    models.append(model_name)
-    
-    return sorted(models)
+    prefix_len = len(MODEL_DIR_PREFIX)
+    with os.scandir(_CACHE_STR) as entries:
+        for entry in entries:
+            dir_name = entry.name
+            if dir_name.startswith(MODEL_DIR_PREFIX) and entry.is_dir():
+                # Convert directory name back to model name format
+                # "models--mlx-community--Llama-3.2-3B-Instruct-4bit" -> "mlx-community/Llama-3.2-3B-Instruct-4bit"
+                # First part is organization, any further "--" in the model name become dashes
+                org, _, model_part = dir_name[prefix_len:].partition("--")
+                if model_part:
+                    yield f"{org}/{model_part.replace('--', '-')}", dir_name
+
+def discover_local_models(sort=True):
+    """Discover all downloaded models in cache directory as (model_name, dir_name)
+
+    Pass sort=False when the order doesn't matter; numbered access must use
+    the sorted order that list_mlx_models shows.
+    """
+    if sort:
+        return sorted(iter_local_models())
+    return list(iter_local_models())
+
+def count_local_models():
+    """Count downloaded models without building a list"""
+    return sum(1 for _ in iter_local_models())
+
+def get_model_by_number(number):
+    """Get (model_name, dir_name) at 1-based position `number` of the sorted list, or None"""
+    if number < 1:
+        return None
+    # Only keep the first `number` names instead of sorting everything
+    first_models = heapq.nsmallest(number, iter_local_models())
+    if len(first_models) < number:
+        return None
+    return first_models[-1]
+
+def get_status_index_path():
+    """Get path of the cached model list used by list_mlx_models"""
+    return Path.home() / ".cache" / "mlx_downloader" / "index.json"
+
+def _cache_mtime():
+    """Modification time of the Hugging Face cache directory, or None"""
+    try:
+        return os.stat(_CACHE_STR).st_mtime_ns
+    except OSError:
+        return None
+
+def _load_status_index(cache_mtime):
+    """Load the saved model list (a dict of columns) if the cache directory is unchanged"""
+    if cache_mtime is None:
+        return None
+    try:
+        with open(get_status_index_path()) as f:
+            index = json.load(f)
+        if index["cache_mtime_ns"] != cache_mtime:
+            return None
+        columns = [index[name] for name in ("names", "dirs", "keys", "statuses", "nfiles")]
+        if len({len(column) for column in columns}) != 1:
+            return None
+        return index
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_status_index(cache_mtime, models, dir_names, keys, statuses, file_counts):
+    """Save model statuses as parallel arrays, keyed by mtimes taken before scanning"""
+    if cache_mtime is None:
+        return
+    index_path = get_status_index_path()
+    tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "cache_mtime_ns": cache_mtime,
+                "names": models,
+                "dirs": dir_names,
+                "keys": keys,
+                "statuses": statuses,
+                "nfiles": file_counts
+            }, f)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass
+
+def _invalidate_status_index():
+    """Drop the cached model list after changing a model's files"""
+    try:
+        get_status_index_path().unlink()
+    except OSError:
+        pass
 
 def list_mlx_models():
     """Show all downloaded MLX models with status"""
     
-    models = discover_local_models()
+    # Stat before scanning, so a change made during the scan is caught next time
+    cache_mtime = _cache_mtime()
+    index = _load_status_index(cache_mtime)
+    if index:
+        models, dir_names = index["names"], index["dirs"]
+    else:
+        local_models = discover_local_models()
+        models = [model for model, _ in local_models]
+        dir_names = [dir_name for _, dir_name in local_models]
+    
+    if models:
+        # Scan model directories concurrently to overlap filesystem latency
+        with ThreadPoolExecutor(max_workers=min(32, len(models))) as executor:
+            # A model's status changes inside its own directory, which doesn't
+            # touch the cache root, so each model keeps its own fingerprint
+            model_paths = [_model_path(model, dir_name) for model, dir_name in zip(models, dir_names)]
+            keys = [list(key) for key in executor.map(_status_key, model_paths)]
+            if index:
+                statuses, file_counts = index["statuses"], index["nfiles"]
+                stale = [i for i, key in enumerate(keys) if key != index["keys"][i]]
+            else:
+                statuses, file_counts = [None] * len(models), [0] * len(models)
+                stale = list(range(len(models)))
+            stale_statuses = executor.map(quick_status, [models[i] for i in stale], [dir_names[i] for i in stale])
+            for i, status in zip(stale, stale_statuses):
+                statuses[i] = status
+                # Only incomplete models need their partial files counted
+                file_counts[i] = len(full_status(models[i], dir_names[i])[2]) if status == "incomplete" else 0
+    else:
+        keys, statuses, file_counts, stale = [], [], [], []
+    
+    if not index or stale:
+        _save_status_index(cache_mtime, models, dir_names, keys, statuses, file_counts)
     
     if not models:
         print("📋 No MLX models found in cache directory")
         print(f"   Cache path: {get_cache_path()}")
         return models
     
-    print(f"📋 Downloaded MLX Models ({len(models)} found):")
-    for i, model in enumerate(models, 1):
-        status, _, files = get_model_status(model)
-        incomplete_files = files if status == "incomplete" else []
-        status_emoji = {
-            "complete": "✅",
-            "incomplete": "⚠️ ",
-            "not_downloaded": "⬜",
-            "no_blobs": "❓",
-            "unknown": "❓"
-        }
-        
-        status_text = {
-            "complete": "Complete",
-            "incomplete": f"Incomplete ({len(incomplete_files)} partial files)",
-            "not_downloaded": "Not downloaded",
-            "no_blobs": "No blobs",
-            "unknown": "Unknown status"
-        }
-        
-        print(f"  {i:2d}. {status_emoji[status]} {model} - {status_text[status]}")
+    # Build the whole listing and write it at once
+    lines = [f"📋 Downloaded MLX Models ({len(models)} found):"]
+    for i, (model, status, file_count) in enumerate(zip(models, statuses, file_counts), 1):
+        status_text = STATUS_TEXT[status].format(n=file_count)
+        lines.append(f"  {i:2d}. {STATUS_EMOJI[status]} {model} - {status_text}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return models
 
+def resolve_model_arg(model_arg, empty_message="❌ No models found in cache directory"):
+    """Resolve a model number from the list or a model name to (model_name, dir_name)
+
+    dir_name is None for model names; both are None if the number is invalid.
+    """
+    # Only model numbers need the cache to be scanned
+    try:
+        number = int(model_arg)
+    except ValueError:
+        return model_arg, None
+    
+    model = get_model_by_number(number)
+    if model:
+        return model
+    
+    model_count = count_local_models()
+    if not model_count:
+        print(empty_message)
+    else:
+        print(f"❌ Invalid number. Choose 1-{model_count}")
+    return None, None
+
 
 def main():
     if len(sys.argv) < 2:
@@ -220,6 +638,10 @@ def main():
         print("  python3 mlx_downloader.py remove <model|num>  # Remove model completely")
         print("  python3 mlx_downloader.py clean-all           # Clean all incomplete files")
         print("")
+        print("Environment:")
+        print(f"  MLX_DL_WORKERS=<n>                            # Parallel file downloads (default {DEFAULT_DOWNLOAD_WORKERS})")
+        print("  MLX_DL_VERBOSE=1                              # Show individual files when cleaning")
+        print("")
         list_mlx_models()
         return
     
@@ -229,116 +651,64 @@ def main():
         list_mlx_models()
         
     elif command == "download" and len(sys.argv) == 3:
+        # download only takes numbers; new models are downloaded by direct name
         try:
-            models = discover_local_models()
-            if not models:
-                print("❌ No models found in cache directory. Use direct model name to download new models.")
-                return
-            
-            index = int(sys.argv[2]) - 1
-            if 0 <= index < len(models):
-                model_name = models[index]
-                # Clean incomplete files first
-                clean_incomplete_model(model_name)
-                download_model(model_name)
-            else:
-                print(f"❌ Invalid number. Choose 1-{len(models)}")
+            int(sys.argv[2])
         except ValueError:
             print("❌ Please provide a valid number")
+            return
+        model_name, _ = resolve_model_arg(
+            sys.argv[2],
+            empty_message="❌ No models found in cache directory. Use direct model name to download new models."
+        )
+        if model_name:
+            download_model(model_name)
     
     elif command == "status" and len(sys.argv) == 3:
-        model_arg = sys.argv[2]
-        
-        # Check if it's a number (index) or model name
-        try:
-            index = int(model_arg) - 1
-            models = discover_local_models()
-            if not models:
-                print("❌ No models found in cache directory")
-                return
-            
-            if 0 <= index < len(models):
-                model_name = models[index]
-            else:
-                print(f"❌ Invalid number. Choose 1-{len(models)}")
-                return
-        except ValueError:
-            # Not a number, treat as model name
-            model_name = model_arg
+        model_name, dir_name = resolve_model_arg(sys.argv[2])
+        if not model_name:
+            return
         
-        status, model_path, files = get_model_status(model_name)
+        status, model_path, files = full_status(model_name, dir_name)
         print(f"📊 Status for {model_name}: {status}")
         if model_path:
             print(f"   Path: {model_path}")
         if files:
             print(f"   Files: {len(files)} files")
             if status == "incomplete":
-                print(f"   Incomplete files: {[f.name for f in files]}")
+                print(f"   Incomplete files: {[os.path.basename(f) for f in files]}")
     
     elif command == "clean" and len(sys.argv) == 3:
-        model_arg = sys.argv[2]
-        
-        # Check if it's a number (index) or model name
-        try:
-            index = int(model_arg) - 1
-            models = discover_local_models()
-            if not models:
-                print("❌ No models found in cache directory")
-                return
-            
-            if 0 <= index < len(models):
-                model_name = models[index]
-                clean_incomplete_model(model_name)
-            else:
-                print(f"❌ Invalid number. Choose 1-{len(models)}")
-        except ValueError:
-            # Not a number, treat as model name
-            model_name = model_arg
-            clean_incomplete_model(model_name)
+        model_name, dir_name = resolve_model_arg(sys.argv[2])
+        if model_name:
+            clean_incomplete_model(model_name, dir_name)
     
     elif command == "remove" and len(sys.argv) == 3:
-        model_arg = sys.argv[2]
-        
-        # Check if it's a number (index) or model name
-        try:
-            index = int(model_arg) - 1
-            models = discover_local_models()
-            if not models:
-                print("❌ No models found in cache directory")
-                return
-            
-            if 0 <= index < len(models):
-                model_name = models[index]
-            else:
-                print(f"❌ Invalid number. Choose 1-{len(models)}")
-                return
-        except ValueError:
-            # Not a number, treat as model name
-            model_name = model_arg
+        model_name, dir_name = resolve_model_arg(sys.argv[2])
+        if not model_name:
+            return
         
         confirm = input(f"⚠️  Are you sure you want to completely remove {model_name}? (y/N): ")
         if confirm.lower() == 'y':
-            remove_model(model_name)
+            remove_model(model_name, dir_name)
         else:
             print("❌ Cancelled")
     
     elif command == "clean-all":
-        models = discover_local_models()
+        models = discover_local_models(sort=False)
         if not models:
             print("❌ No models found in cache directory")
             return
         
         cleaned_count = 0
-        for model in models:
-            if clean_incomplete_model(model):
+        for model, dir_name in models:
+            if clean_incomplete_model(model, dir_name):
                 cleaned_count += 1
         print(f"🧹 Cleaned incomplete files for {cleaned_count} models")
             
     else:
         # Direct model name
         model_name = sys.argv[1]
-        # Clean incomplete files first
-        clean_incomplete_model(model_name)
         download_model(model_name)
 
 